@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import curses
+import os
+import queue
+import select
 import signal
-from types import SimpleNamespace
-from typing import Sequence
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Sequence
 
 from .audio import play_sfx
 from .constants import (
@@ -16,9 +22,12 @@ from .constants import (
 )
 from .curses_setup import init_curses
 from .keystore import (
-    find_entry_index_by_alias,
     get_keystore_entries,
     check_unsaved_changes,
+    find_entry_index_by_alias,
+    refresh_entry,
+    drop_cached_entry,
+    rename_cached_entry,
     save_changes,
 )
 from .keystore_actions import (
@@ -36,55 +45,354 @@ from .keystore_actions import (
 from .input_listener import start_modifier_monitor, stop_modifier_monitor
 from .menu import menu_modal
 from .state import AppState
-from .ui.layout import draw_clock, draw_footer, draw_menu_bar, draw_ui, highlight_footer_key, get_menu_item_positions
+from .ui.layout import draw_clock, draw_footer, draw_menu_bar, draw_ui, highlight_footer_key, get_menu_item_at
 from .ui.popups import prompt_import_key_type, show_help_popup
 
 
+# Without select() on the terminal (Windows consoles) we fall back to polling
+# at this interval so shift transitions are still picked up promptly.
+_SHIFT_POLL_MS = 100
+_CAN_SELECT_STDIN = os.name == "posix"
+# PDCurses (windows-curses) reports KEY_RESIZE but leaves resizing its own
+# screen to the application; ncurses has already resized when it is reported.
+_RESIZE_ON_KEY_RESIZE = os.name == "nt"
+# select() is retried after EINTR (PEP 475), so SIGWINCH alone never wakes the
+# loop; a handler that writes to the wake pipe does.
+_CAN_WAKE_ON_SIGWINCH = _CAN_SELECT_STDIN and hasattr(signal, "SIGWINCH")
+
+
+def _ms_until_next_tick() -> int:
+    """Return the milliseconds left before the clock's displayed second changes."""
+
+    return 1000 - int(time.time() * 1000) % 1000
+
+
+def _open_wake_pipe() -> tuple[int | None, int | None]:
+    """Return a non-blocking ``(read_fd, write_fd)`` pair used to wake the main loop."""
+
+    if not _CAN_SELECT_STDIN:
+        return None, None
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    return read_fd, write_fd
+
+
+def _wake(write_fd: int | None) -> None:
+    """Interrupt a pending :func:`_wait_for_input` from another thread."""
+
+    if write_fd is None:
+        return
+    try:
+        os.write(write_fd, b"\0")
+    except (BlockingIOError, OSError):
+        # A full pipe already guarantees a wakeup.
+        pass
+
+
+def _resize_to_terminal() -> None:
+    """Resize the curses screen to the terminal's current size.
+
+    Needed once our SIGWINCH handler has replaced the one ncurses installs,
+    since ncurses then no longer notices the resize on its own.
+    """
+
+    try:
+        size = os.get_terminal_size(sys.__stdout__.fileno())
+    except (AttributeError, OSError, ValueError):
+        return
+    if curses.is_term_resized(size.lines, size.columns):
+        curses.resizeterm(size.lines, size.columns)
+    curses.update_lines_cols()
+
+
+def _read_pending_key(stdscr: "curses.window") -> int:
+    """Return an already queued key without blocking, or ``-1``."""
+
+    stdscr.nodelay(True)
+    try:
+        return stdscr.getch()
+    finally:
+        stdscr.nodelay(False)
+
+
+def _wait_for_input(stdscr: "curses.window", wake_fd: int | None, timeout_ms: int) -> int:
+    """Block until a key arrives, ``wake_fd`` is written to or ``timeout_ms`` elapses.
+
+    Returns the key code, or ``-1`` when woken without input.
+    """
+
+    if wake_fd is None:
+        stdscr.timeout(min(timeout_ms, _SHIFT_POLL_MS))
+        try:
+            return stdscr.getch()
+        finally:
+            stdscr.timeout(-1)
+
+    stdscr.nodelay(True)
+    try:
+        # curses may already hold buffered input that select() cannot see.
+        key = stdscr.getch()
+        if key != -1:
+            return key
+        try:
+            readable, _, _ = select.select([sys.stdin, wake_fd], [], [], timeout_ms / 1000)
+        except (OSError, ValueError):
+            readable = []
+        if wake_fd in readable:
+            try:
+                while os.read(wake_fd, 64):
+                    pass
+            except BlockingIOError:
+                pass
+        return stdscr.getch()
+    finally:
+        stdscr.nodelay(False)
+
+
+# Function key codes mapped to (zero-based index, shift implied), built once.
+# Terminals that report shifted F-keys as F13..F22 are only supported when
+# curses defines KEY_F13.
+_FKEY_MAP: dict[int, tuple[int, bool]] = {curses.KEY_F1 + index: (index, False) for index in range(10)}
+if hasattr(curses, "KEY_F13"):
+    _FKEY_MAP.update({curses.KEY_F13 + index: (index, True) for index in range(10)})
+
+
 def _resolve_function_key_index(key_code: int) -> tuple[int, bool] | None:
     """Return the zero-based function key index and whether shift was implied."""
 
-    if curses.KEY_F1 <= key_code <= curses.KEY_F10:
-        return key_code - curses.KEY_F1, False
+    return _FKEY_MAP.get(key_code)
+
+
+def _move_selection(
+    selected: int, scroll_offset: int, delta: int, entry_count: int, panel_height: int
+) -> tuple[int, int]:
+    """Return ``(selected, scroll_offset)`` after moving by ``delta``, keeping the selection visible."""
 
-    shift_start = getattr(curses, "KEY_F13", None)
-    if shift_start is not None and shift_start <= key_code <= shift_start + 9:
-        return key_code - shift_start, True
+    selected = max(0, min(entry_count - 1, selected + delta))
+    scroll_offset = max(0, min(scroll_offset, selected), selected - panel_height + 1)
+    return selected, scroll_offset
 
+
+def _import_key_pair(stdscr: "curses.window", state: AppState) -> str | None:
+    """Ask which key pair format to import and run the matching importer."""
+
+    choice = prompt_import_key_type(stdscr)
+    if choice == "PKCS #12":
+        return import_pkcs12_keypair(stdscr, state)
+    if choice == "PKCS #8":
+        return import_pkcs8_keypair(stdscr, state)
     return None
 
 
-def _capture_escape_sequence(stdscr: "curses.window") -> tuple[str | None, list[int]]:
-    """Capture any pending escape sequence following an initial ESC key press."""
+# Shift+F-key actions that add an entry, keyed by function key index. Each
+# returns the alias it created (or ``None``) so the list can select it.
+_SHIFT_FKEY_ACTIONS: dict[int, Callable[["curses.window", AppState], str | None]] = {
+    1: generate_key_pair,
+    2: _import_key_pair,
+    3: import_cert_file,
+    4: import_cert_from_url,
+}
+
+
+@dataclass
+class _FKeyContext:
+    """Loop state handed to the F-key handlers, which update it in place."""
+
+    entries: list[dict]
+    selected: int
+    redraw_dimmed: Callable[[], None]
+
+    @property
+    def entry(self) -> dict | None:
+        return self.entries[self.selected] if self.entries else None
+
+
+def _show_help(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    context.redraw_dimmed()
+    show_help_popup(stdscr)
+    return True
+
+
+def _export_selected(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    entry = context.entry
+    alias = entry.get("Alias name") if entry else None
+    if alias:
+        context.redraw_dimmed()
+        export_entry(stdscr, state, alias, entry.get("Entry type", ""))
+    return True
+
+
+def _rename_selected(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    entry = context.entry
+    alias = entry.get("Alias name") if entry else None
+    if alias:
+        context.redraw_dimmed()
+        renamed_alias = rename_entry_alias(stdscr, state, alias)
+        if renamed_alias and renamed_alias != alias:
+            context.entries = rename_cached_entry(state, context.entries, alias, renamed_alias)
+            context.selected = find_entry_index_by_alias(state, renamed_alias)
+            check_unsaved_changes(state)
+    return True
+
+
+def _set_selected_password(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    entry = context.entry
+    alias = entry.get("Alias name") if entry else None
+    if alias and entry.get("__is_private_key__", False):
+        context.redraw_dimmed()
+        change_entry_password(stdscr, state, alias)
+        check_unsaved_changes(state)
+    return True
+
+
+def _delete_selected(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    entry = context.entry
+    if entry is None:
+        return True
+    context.redraw_dimmed()
+    if delete_entry(entry.get("Alias name"), stdscr, state):
+        context.entries = drop_cached_entry(state, context.entries, entry.get("Alias name", ""))
+        context.selected = max(0, min(context.selected, len(context.entries) - 1))
+    return True
+
+
+def _open_menu(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    context.redraw_dimmed()
+    menu_modal(
+        stdscr,
+        state,
+        0,
+        redraw_main_ui=context.redraw_dimmed,
+    )
+    return True
+
+
+def _save_and_quit(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+    return save_changes(stdscr, state) is not None
+
+
+# Plain F-key handlers, keyed by function key index; keys without an entry
+# (F2, F4, F5) do nothing. Each returns ``False`` when the app should exit.
+_FKEY_HANDLERS: dict[int, Callable[["curses.window", AppState, _FKeyContext], bool]] = {
+    0: _show_help,
+    2: _export_selected,
+    5: _rename_selected,
+    6: _set_selected_password,
+    7: _delete_selected,
+    8: _open_menu,
+    9: _save_and_quit,
+}
+
+
+def _add_entry_handler(
+    action: Callable[["curses.window", AppState], str | None],
+) -> Callable[["curses.window", AppState, _FKeyContext], bool]:
+    """Wrap a Shift+F-key action as a handler that selects the entry it added."""
+
+    def handler(stdscr: "curses.window", state: AppState, context: _FKeyContext) -> bool:
+        context.redraw_dimmed()
+        alias = action(stdscr, state)
+        if alias:
+            context.entries = refresh_entry(state, context.entries, alias)
+            context.selected = find_entry_index_by_alias(state, alias)
+            check_unsaved_changes(state)
+        return True
+
+    return handler
+
+
+# Shift+F-key handlers; indexes without one fall back to the plain handler.
+_SHIFT_FKEY_HANDLERS = {index: _add_entry_handler(action) for index, action in _SHIFT_FKEY_ACTIONS.items()}
+
+
+# Footer labels keyed by (shift held, hide F7). F7 SetPwd only applies to
+# private keys, so its label is blanked while another entry type is selected.
+_SHIFT_FOOTER = tuple(SHIFT_FOOTER_OPTIONS)
+_FOOTER_TABLE: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (False, False): tuple(FOOTER_OPTIONS),
+    (False, True): tuple(" 7      " if index == 6 else option for index, option in enumerate(FOOTER_OPTIONS)),
+    (True, False): _SHIFT_FOOTER,
+    (True, True): _SHIFT_FOOTER,
+}
+
+
+def _footer_options(shift: bool, entry: dict | None) -> tuple[str, ...]:
+    """Return the footer labels for the shift state and the selected entry."""
+
+    hide_set_password = entry is not None and not entry.get("__is_private_key__", False)
+    return _FOOTER_TABLE[(shift, hide_set_password)]
+
+
+# Mouse event masks. The wheel masks differ between ncurses mouse ABIs, so
+# take them from curses; 0x8000000 is what ABI 1 builds report for wheel-down.
+_BUTTON1_EVENTS = curses.BUTTON1_CLICKED | curses.BUTTON1_PRESSED | curses.BUTTON1_RELEASED
+_SCROLL_UP = curses.BUTTON4_PRESSED
+_SCROLL_DOWN = getattr(curses, "BUTTON5_PRESSED", 0x8000000)
+
+# Jump to the top/bottom of the active panel, like the "top"/"bot" labels.
+_KEY_TOP = ord("t")
+_KEY_BOTTOM = ord("b")
+
+# Some terminals send Shift+F3 as a raw CSI sequence instead of KEY_F15.
+# These are the codes that follow the ESC ("[1;2R" and "[13;2~").
+_SHIFT_F3_CODES = ([91, 49, 59, 50, 82], [91, 49, 51, 59, 50, 126])
+# Longest sequence worth capturing; bounds the drain after a lone ESC. CSI
+# sequences for cursor and function keys fit in 7 codes, and anything left
+# unread is simply returned by the next getch().
+_ESCAPE_CAPTURE_LIMIT = 8
+
+
+def _undecoded_shift_f3_codes() -> tuple[list[int], ...]:
+    """Return the raw Shift+F3 sequences worth capturing after a bare ESC.
+
+    When terminfo defines ``kf15`` curses decodes the terminal's Shift+F3 to
+    KEY_F15 itself, so nothing needs capturing; otherwise every known
+    sequence is a candidate.
+    """
+
+    try:
+        decoded = curses.tigetstr("kf15")
+    except curses.error:
+        decoded = None
+    return () if decoded else _SHIFT_F3_CODES
+
+
+def _capture_escape_sequence(
+    stdscr: "curses.window", sequences: Sequence[list[int]] = _SHIFT_F3_CODES
+) -> tuple[bool, list[int]]:
+    """Capture any pending escape sequence following an initial ESC key press.
+
+    Returns whether the codes formed one of ``sequences``, and the consumed key codes.
+    """
 
     captured: list[int] = []
     stdscr.nodelay(True)
     try:
-        while True:
+        for _ in range(_ESCAPE_CAPTURE_LIMIT):
             ch = stdscr.getch()
             if ch == -1:
                 break
             captured.append(ch)
+            if ch > 0xFF:
+                # A decoded curses key code cannot be part of a raw sequence.
+                break
+            if captured in sequences:
+                return True, captured
     finally:
         stdscr.nodelay(False)
-        stdscr.timeout(100)
 
-    if not captured:
-        return None, captured
-
-    try:
-        sequence = bytes([27, *captured]).decode("ascii", errors="ignore")
-    except ValueError:
-        sequence = None
-
-    return sequence, captured
+    return False, captured
 
 
 def run_app(stdscr: "curses.window", argv: Sequence[str]) -> None:
     """Entry point for the curses application."""
     state = AppState()
     init_curses()
-    stdscr.timeout(100)
+    stdscr.timeout(-1)
     signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Raw Shift+F3 sequences only need capturing when terminfo lacks them.
+    shift_f3_codes = _undecoded_shift_f3_codes()
 
     keystore_arg = argv[0] if argv else None
 
@@ -93,28 +401,84 @@ def run_app(stdscr: "curses.window", argv: Sequence[str]) -> None:
     detail_scroll = 0
     active_panel = LEFT_PANEL
 
-    entries = [SimpleNamespace(get=lambda k, default=None: {"Alias name": ""}.get(k, default))]  # type: ignore
-    draw_ui(
-        stdscr,
-        state,
-        entries,
-        selected,
-        scroll_offset,
-        detail_scroll,
-        active_panel,
-        True,
-    )
+    # draw_ui renders its placeholder row until the keystore is open.
+    entries: list[dict] = []
+
+    def redraw_dimmed() -> None:
+        """Repaint the main UI dimmed behind a modal, using the loop's current view.
+
+        Also marks the frame dirty so the loop repaints it exactly once, undimmed,
+        after the modal returns.
+        """
+        nonlocal needs_redraw
+        needs_redraw = True
+        draw_ui(
+            stdscr,
+            state,
+            entries,
+            selected,
+            scroll_offset,
+            detail_scroll,
+            active_panel,
+            True,
+        )
+        curses.doupdate()
+
+    redraw_dimmed()
 
     open_keystore(stdscr, state, keystore_arg)
 
     entries = get_keystore_entries(state)
-    modifier_monitor = start_modifier_monitor()
+    wake_r, wake_w = _open_wake_pipe()
+    # The monitor pushes shift transitions from its own thread; the loop only
+    # consumes them, so it never has to poll the listener's key set.
+    shift_events: queue.SimpleQueue[bool] = queue.SimpleQueue()
+
+    def _on_shift_change(pressed: bool) -> None:
+        shift_events.put(pressed)
+        _wake(wake_w)
+
+    # The handler only flags the resize; the loop applies it between events
+    # rather than in the middle of whatever curses call was interrupted.
+    resize_pending = False
+
+    def _on_sigwinch(signum: int, frame: object) -> None:
+        nonlocal resize_pending
+        resize_pending = True
+        _wake(wake_w)
+
+    if _CAN_WAKE_ON_SIGWINCH:
+        signal.signal(signal.SIGWINCH, _on_sigwinch)
+
+    modifier_monitor = start_modifier_monitor(on_change=_on_shift_change)
+    shift_active = modifier_monitor.is_shift_pressed()
     previous_shift_state = False
+    needs_redraw = True
+    drawn_frame_key: tuple | None = None
+    drawn_footer_key: tuple | None = None
+    footer_options_inputs: tuple | None = None
+    detail_len_key: tuple | None = None
+    # Codes read past a lone ESC that did not form a known sequence; they are
+    # replayed as regular keys before reading from the terminal again.
+    pending_codes: deque[int] = deque()
+    clock_second = -1
 
     try:
         while True:
-            height, width = stdscr.getmaxyx()
-            shift_active = modifier_monitor.is_shift_pressed()
+            if resize_pending:
+                resize_pending = False
+                _resize_to_terminal()
+                needs_redraw = True
+            # Without the SIGWINCH handler resizes arrive as KEY_RESIZE, which
+            # only reaches this loop when no modal consumed it first, so the
+            # cached size is also re-read whenever a modal marked the frame dirty.
+            if needs_redraw:
+                height, width = stdscr.getmaxyx()
+                half_width = width // 2
+                # Left edge of the clickable "top"/"bot" labels on the list border
+                jump_label_x = half_width - 6
+                bottom_row = height - 2
+                panel_height = height - 4
 
             # Toggle mouse support based on shift key state
             if shift_active != previous_shift_state:
@@ -128,174 +492,182 @@ def run_app(stdscr: "curses.window", argv: Sequence[str]) -> None:
                     state.mouse_enabled = True
                 previous_shift_state = shift_active
 
-            # Update footer options dynamically
-            current_footer = list(SHIFT_FOOTER_OPTIONS if shift_active else FOOTER_OPTIONS)
-            if not shift_active and entries:
-                selected_entry = entries[selected]
-                entry_type = selected_entry.get("Entry type", "").lower()
-                if "privatekeyentry" not in entry_type:
-                    # Hide F7 SetPwd if not private key
-                    current_footer[6] = " 7      "
-
-            footer_options = current_footer
-            panel_height = height - 4
             if state.reload_entries:
                 state.reload_entries = False
                 entries = get_keystore_entries(state)
                 selected = 0
                 scroll_offset = 0
                 detail_scroll = 0
-
-            draw_ui(
-                stdscr,
-                state,
-                entries,
-                selected,
-                scroll_offset,
-                detail_scroll,
-                active_panel,
-            )
-            draw_footer(stdscr, state, footer_options)
-            draw_menu_bar(None, width, state)
-            draw_clock(stdscr, width)
-
-            key = stdscr.getch()
+            entry_count = len(entries)
+
+            # Length of the selected entry's detail view, for bounding detail_scroll
+            selection_key = (selected, id(entries))
+            if selection_key != detail_len_key:
+                detail_len_key = selection_key
+                detail_len = len(entries[selected].get("__rendered__", ())) if entries else 0
+
+            # Update footer options only when shift or the selected entry changed
+            footer_inputs = (shift_active, selected, id(entries))
+            if footer_inputs != footer_options_inputs:
+                footer_options_inputs = footer_inputs
+                footer_options = _footer_options(shift_active, entries[selected] if entries else None)
+
+            # Handle input that queued up while the last event was processed
+            # before painting, so a burst (wheel spin, key repeat) costs one frame.
+            key = pending_codes.popleft() if pending_codes else _read_pending_key(stdscr)
+            if key == -1:
+                # Only repaint what the last event actually changed; modals set
+                # ``needs_redraw`` because they paint over the main screen.
+                frame_key = (
+                    height,
+                    width,
+                    selected,
+                    scroll_offset,
+                    detail_scroll,
+                    active_panel,
+                    state.has_unsaved_changes,
+                    id(entries),
+                )
+                if needs_redraw or frame_key != drawn_frame_key:
+                    draw_ui(
+                        stdscr,
+                        state,
+                        entries,
+                        selected,
+                        scroll_offset,
+                        detail_scroll,
+                        active_panel,
+                    )
+                    draw_menu_bar(None, width, state)
+                    drawn_frame_key = frame_key
+                    clock_second = -1
+                footer_key = (height, width, *footer_options)
+                if needs_redraw or footer_key != drawn_footer_key:
+                    draw_footer(stdscr, state, footer_options)
+                    drawn_footer_key = footer_key
+                    clock_second = -1
+                needs_redraw = False
+
+                if int(time.time()) != clock_second:
+                    draw_clock(stdscr, width)
+                    clock_second = int(time.time())
+                # Everything above only staged its window; write the frame once.
+                curses.doupdate()
+
+                # Sleep until input, a shift transition or the next clock tick.
+                key = _wait_for_input(stdscr, wake_r, _ms_until_next_tick())
+            while not shift_events.empty():
+                shift_active = shift_events.get_nowait()
 
             if key == -1:
                 continue
+            if key == curses.KEY_RESIZE:
+                if _RESIZE_ON_KEY_RESIZE:
+                    curses.resize_term(0, 0)
+                needs_redraw = True
+                continue
 
-            consumed_codes: list[int] = []
             fkey_info: tuple[int, bool] | None = _resolve_function_key_index(key)
-            if key == 27 and fkey_info is None:
-                seq, consumed_codes = _capture_escape_sequence(stdscr)
-                if seq in ("\x1b[1;2R", "\x1b[13;2~"):
+            if key == 27 and fkey_info is None and shift_f3_codes:
+                is_shift_f3, consumed_codes = _capture_escape_sequence(stdscr, shift_f3_codes)
+                if is_shift_f3:
                     fkey_info = (2, True)
                 else:
-                    for code in reversed(consumed_codes):
-                        curses.ungetch(code)
+                    pending_codes.extend(consumed_codes)
 
-            if key == curses.KEY_MOUSE and state.mouse_enabled:
+            if key == curses.KEY_MOUSE:
                 try:
+                    # Always dequeue the event, even when the mouse is disabled.
                     _, mx, my, _, mouse_event = curses.getmouse()
+                    if not state.mouse_enabled:
+                        continue
 
                     if my == 0:
-                        # Get accurate menu item positions
-                        menu_positions = get_menu_item_positions()
-                        for i, (start_x, end_x) in enumerate(menu_positions):
-                            if start_x <= mx < end_x:
-                                active_menu = i
-                                draw_ui(
-                                    stdscr,
-                                    state,
-                                    entries,
-                                    selected,
-                                    scroll_offset,
-                                    detail_scroll,
-                                    active_panel,
-                                    True,
-                                )
-                                menu_modal(
-                                    stdscr,
-                                    state,
-                                    active_menu,
-                                    redraw_main_ui=lambda: draw_ui(
-                                        stdscr,
-                                        state,
-                                        entries,
-                                        selected,
-                                        scroll_offset,
-                                        detail_scroll,
-                                        active_panel,
-                                        True,
-                                    ),
-                                )
-                                break
-
-                    if my == 1 and width // 2 - 6 <= mx < width // 2:
+                        active_menu = get_menu_item_at(mx)
+                        if active_menu is not None:
+                            redraw_dimmed()
+                            menu_modal(
+                                stdscr,
+                                state,
+                                active_menu,
+                                redraw_main_ui=redraw_dimmed,
+                            )
+                            curses.flushinp()
+                            pending_codes.clear()
+
+                    if my == 1 and jump_label_x <= mx < half_width:
                         selected = 0
                         scroll_offset = 0
-                    elif my == height - 2 and width // 2 - 6 <= mx < width // 2:
-                        selected = len(entries) - 1
-                        scroll_offset = max(0, len(entries) - panel_height)
+                    elif my == bottom_row and jump_label_x <= mx < half_width:
+                        selected = entry_count - 1
+                        scroll_offset = max(0, entry_count - panel_height)
 
-                    if 1 < my < height - 2:
-                        if 0 < mx < width // 2:
+                    if 1 < my < bottom_row:
+                        if 0 < mx < half_width:
                             if active_panel != LEFT_PANEL:
                                 active_panel = LEFT_PANEL
                                 play_sfx("swipe-left")
                             # Handle click selection
-                            if mouse_event & (
-                                curses.BUTTON1_CLICKED
-                                | curses.BUTTON1_PRESSED
-                                | curses.BUTTON1_RELEASED
-                            ):
+                            if mouse_event & _BUTTON1_EVENTS:
                                 clicked_index = my - 2 + scroll_offset
-                                if 0 <= clicked_index < len(entries):
+                                if 0 <= clicked_index < entry_count:
                                     selected = clicked_index
                                     detail_scroll = 0
-                        elif mx >= width // 2:
+                        elif mx >= half_width:
                             if active_panel != RIGHT_PANEL:
                                 active_panel = RIGHT_PANEL
                                 play_sfx("swipe-right")
 
-                    if mouse_event & 0x80000:
+                    if mouse_event & _SCROLL_UP:
                         if active_panel == LEFT_PANEL and selected > 0:
-                            selected -= 1
-                            if selected < scroll_offset:
-                                scroll_offset -= 1
+                            selected, scroll_offset = _move_selection(
+                                selected, scroll_offset, -1, entry_count, panel_height
+                            )
                             detail_scroll = 0
                         elif active_panel == RIGHT_PANEL and detail_scroll > 0:
                             detail_scroll -= 1
 
-                    elif mouse_event & 0x8000000:
-                        if active_panel == LEFT_PANEL and selected < len(entries) - 1:
-                            selected += 1
-                            if selected >= scroll_offset + panel_height:
-                                scroll_offset += 1
+                    elif mouse_event & _SCROLL_DOWN:
+                        if active_panel == LEFT_PANEL and selected < entry_count - 1:
+                            selected, scroll_offset = _move_selection(
+                                selected, scroll_offset, 1, entry_count, panel_height
+                            )
                             detail_scroll = 0
                         elif active_panel == RIGHT_PANEL:
-                            detail_scroll += 1
+                            detail_scroll = min(detail_scroll + 1, max(0, detail_len - 1))
                 except curses.error:
                     pass
                 continue
 
             if key == curses.KEY_UP:
                 if active_panel == LEFT_PANEL:
-                    if selected > 0:
-                        selected -= 1
-                        if selected < scroll_offset:
-                            scroll_offset -= 1
+                    selected, scroll_offset = _move_selection(selected, scroll_offset, -1, entry_count, panel_height)
                     detail_scroll = 0
                 elif active_panel == RIGHT_PANEL and detail_scroll > 0:
                     detail_scroll -= 1
 
             elif key == curses.KEY_DOWN:
                 if active_panel == LEFT_PANEL:
-                    if selected < len(entries) - 1:
-                        selected += 1
-                        if selected >= scroll_offset + panel_height:
-                            scroll_offset += 1
+                    selected, scroll_offset = _move_selection(selected, scroll_offset, 1, entry_count, panel_height)
                     detail_scroll = 0
                 elif active_panel == RIGHT_PANEL:
-                    detail_scroll += 1
+                    detail_scroll = min(detail_scroll + 1, max(0, detail_len - 1))
 
-            elif key == ord("t"):
+            elif key == _KEY_TOP:
                 if active_panel == LEFT_PANEL:
                     selected = 0
                     scroll_offset = 0
                 else:
                     detail_scroll = 0
 
-            elif key == ord("b"):
+            elif key == _KEY_BOTTOM:
                 if active_panel == LEFT_PANEL:
-                    selected = len(entries) - 1
-                    scroll_offset = max(0, len(entries) - panel_height)
+                    selected = entry_count - 1
+                    scroll_offset = max(0, entry_count - panel_height)
                 else:
-                    detail_scroll = max(
-                        0, len(entries[selected].get("__rendered__", [])) - 1
-                    )
+                    detail_scroll = max(0, detail_len - 1)
 
-            elif key in (ord("\t"), 9):
+            elif key == 9:
                 if active_panel == LEFT_PANEL:
                     active_panel = RIGHT_PANEL
                     play_sfx("swipe-right")
@@ -305,218 +677,39 @@ def run_app(stdscr: "curses.window", argv: Sequence[str]) -> None:
 
             elif fkey_info is not None:
                 key_index, shift_from_code = fkey_info
-                shift_active = shift_from_code or modifier_monitor.is_shift_pressed()
-
-                # Update footer options dynamically for highlighting
-                current_footer = list(SHIFT_FOOTER_OPTIONS if shift_active else FOOTER_OPTIONS)
-                if not shift_active and entries:
-                    selected_entry = entries[selected]
-                    entry_type = selected_entry.get("Entry type", "").lower()
-                    if "privatekeyentry" not in entry_type:
-                        current_footer[6] = " 7      "
-
-                footer_options = current_footer
-
-                if 0 <= key_index < len(footer_options):
-                    highlight_footer_key(stdscr, key_index, footer_options)
-
-                if shift_active:
-                    if key_index == 1:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        alias = generate_key_pair(stdscr, state)
-                        if alias:
-                            entries = get_keystore_entries(state)
-                            selected = find_entry_index_by_alias(entries, alias)
-                            check_unsaved_changes(state)
-                        continue
-
-                    if key_index == 2:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        choice = prompt_import_key_type(stdscr)
-                        if choice == "PKCS #12":
-                            alias = import_pkcs12_keypair(stdscr, state)
-                        elif choice == "PKCS #8":
-                            alias = import_pkcs8_keypair(stdscr, state)
-                        else:
-                            alias = None
-                        if alias:
-                            entries = get_keystore_entries(state)
-                            selected = find_entry_index_by_alias(entries, alias)
-                            check_unsaved_changes(state)
-                        continue
-
-                    if key_index == 3:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        alias = import_cert_file(stdscr, state)
-                        if alias:
-                            entries = get_keystore_entries(state)
-                            selected = find_entry_index_by_alias(entries, alias)
-                            check_unsaved_changes(state)
-                        continue
-
-                    if key_index == 4:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        alias = import_cert_from_url(stdscr, state)
-                        if alias:
-                            entries = get_keystore_entries(state)
-                            selected = find_entry_index_by_alias(entries, alias)
-                            check_unsaved_changes(state)
-                        continue
-
-                if key_index == 0:
-                    draw_ui(
-                        stdscr,
-                        state,
-                        entries,
-                        selected,
-                        scroll_offset,
-                        detail_scroll,
-                        active_panel,
-                        True,
-                    )
-                    show_help_popup(stdscr)
-
-                elif key_index == 1:
-                    # F2 is now free/empty
-                    pass
-
-                elif key_index == 2 and entries:
-                    alias = entries[selected].get("Alias name")
-                    entry_type = entries[selected].get("Entry type", "")
-                    if alias:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        export_entry(stdscr, state, alias, entry_type)
-
-                elif key_index == 5 and entries:
-                    alias = entries[selected].get("Alias name")
-                    if alias:
-                        draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        )
-                        renamed_alias = rename_entry_alias(stdscr, state, alias)
-                        if renamed_alias and renamed_alias != alias:
-                            entries = get_keystore_entries(state)
-                            selected = find_entry_index_by_alias(entries, renamed_alias)
-                            check_unsaved_changes(state)
-
-                elif key_index == 6:
-                    if entries:
-                        alias = entries[selected].get("Alias name")
-                        entry_type = entries[selected].get("Entry type", "").lower()
-                        if alias and "privatekeyentry" in entry_type:
-                            draw_ui(
-                                stdscr,
-                                state,
-                                entries,
-                                selected,
-                                scroll_offset,
-                                detail_scroll,
-                                active_panel,
-                                True,
-                            )
-                            change_entry_password(stdscr, state, alias)
-                            check_unsaved_changes(state)
-
-                elif key_index == 7:
-                    draw_ui(
-                        stdscr,
-                        state,
-                        entries,
-                        selected,
-                        scroll_offset,
-                        detail_scroll,
-                        active_panel,
-                        True,
-                    )
-                    if delete_entry(entries[selected].get("Alias name"), stdscr, state):
-                        entries = get_keystore_entries(state)
-                        selected = min(selected, len(entries) - 1)
-
-                elif key_index == 8:
-                    draw_ui(
-                        stdscr,
-                        state,
-                        entries,
-                        selected,
-                        scroll_offset,
-                        detail_scroll,
-                        active_panel,
-                        True,
-                    )
-                    menu_modal(
-                        stdscr,
-                        state,
-                        0,
-                        redraw_main_ui=lambda: draw_ui(
-                            stdscr,
-                            state,
-                            entries,
-                            selected,
-                            scroll_offset,
-                            detail_scroll,
-                            active_panel,
-                            True,
-                        ),
-                    )
-
-                elif key_index == 9:
-                    result = save_changes(stdscr, state)
-                    if result is None:
+                needs_redraw = True
+                fkey_shift = shift_from_code or shift_active
+
+                # Footer options matching the pressed key, for highlighting
+                highlight_options = _footer_options(fkey_shift, entries[selected] if entries else None)
+
+                if 0 <= key_index < len(highlight_options):
+                    highlight_footer_key(stdscr, key_index, highlight_options)
+
+                handler = _SHIFT_FKEY_HANDLERS.get(key_index) if fkey_shift else None
+                if handler is None:
+                    handler = _FKEY_HANDLERS.get(key_index)
+                if handler is not None:
+                    context = _FKeyContext(entries, selected, redraw_dimmed)
+                    keep_running = handler(stdscr, state, context)
+                    entries, selected = context.entries, context.selected
+                    entry_count = len(entries)
+                    if not keep_running:
                         break
 
-            if state.has_unsaved_changes and selected == len(entries) - 1:
-                scroll_offset = max(0, len(entries) - panel_height)
+                # Drop keys typed while the modal was busy (keytool, network).
+                curses.flushinp()
+                pending_codes.clear()
+
+            if state.has_unsaved_changes and selected == entry_count - 1:
+                scroll_offset = max(0, entry_count - panel_height)
     finally:
+        if _CAN_WAKE_ON_SIGWINCH:
+            # ncurses' own handler is not visible to Python and cannot be
+            # restored; the default (ignore) at least stops writes to the
+            # wake pipe once it is closed below.
+            signal.signal(signal.SIGWINCH, signal.SIG_DFL)
         stop_modifier_monitor()
+        for fd in (wake_r, wake_w):
+            if fd is not None:
+                os.close(fd)
@@ -2,21 +2,55 @@
 
 from __future__ import annotations
 
-import subprocess
-import threading
-import platform
+import os
+import sys
+from functools import lru_cache
 
 from .constants import BASE_DIR
 
+# Playback relies on macOS' ``afplay``; checked once instead of importing
+# ``platform`` just to ask on every call.
+_IS_MACOS = sys.platform == "darwin"
+
+_SFX_DIR = BASE_DIR / "sfx"
+
+# Players started by play_sfx that have not been reaped yet.
+_players: set[int] = set()
+
+
+def _reap_players() -> None:
+    """Collect players that have exited so they do not linger as zombies."""
+
+    for pid in list(_players):
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            _players.discard(pid)
+
+
+@lru_cache(maxsize=32)
+def _sfx_path(sound_file: str) -> str:
+    return str(_SFX_DIR / f"{sound_file}.mp3")
+
+
+@lru_cache(maxsize=16)
+def _volume_arg(volume: float) -> str:
+    return format(volume, "g")
+
 
 def play_sfx(sound_file: str, volume: float = 0.6) -> None:
     """Play a short sound effect asynchronously."""
 
-    if platform.system() != "Darwin":
+    if not _IS_MACOS:
         return  # skip on non-macOS systems
 
-    def _play() -> None:
-        sfx_file = BASE_DIR / "sfx" / f"{sound_file}.mp3"
-        subprocess.Popen(["afplay", sfx_file, "-v", str(volume)])
-
-    threading.Thread(target=_play, daemon=True).start()
+    _reap_players()
+    try:
+        # posix_spawn returns as soon as the player is started, so no helper
+        # thread is needed to keep the UI from waiting on it.
+        pid = os.posix_spawnp("afplay", ["afplay", _sfx_path(sound_file), "-v", _volume_arg(volume)], os.environ)
+    except OSError:
+        return
+    _players.add(pid)
@@ -26,28 +26,44 @@ from .constants import (
 )
 
 
+# (pair, foreground, background); -1 keeps the terminal's default background.
+_COLOR_PAIRS: tuple[tuple[int, int, int], ...] = (
+    (COLOR_PAIR_SELECTED, curses.COLOR_BLACK, 80),
+    (COLOR_PAIR_SELECTED_DIM, curses.COLOR_BLACK, 73),
+    (COLOR_PAIR_SELECTED_DIM_MORE, curses.COLOR_BLACK, 23),
+    (COLOR_PAIR_HEADER, curses.COLOR_YELLOW, -1),
+    (COLOR_PAIR_MENU, curses.COLOR_BLACK, curses.COLOR_YELLOW),
+    (COLOR_PAIR_FKEYS, curses.COLOR_BLACK, curses.COLOR_WHITE),
+    (COLOR_PAIR_WHITE, 231, -1),
+    (COLOR_PAIR_WHITE_DIM, curses.COLOR_WHITE, -1),
+    (COLOR_PAIR_DARK, 245, -1),
+    (COLOR_PAIR_DARKER, 237, -1),
+    (COLOR_PAIR_CYAN, 116, -1),
+    (COLOR_PAIR_CYAN_DIM, 73, -1),
+    (COLOR_PAIR_EXPIRED, COLOR_EXPIRED_RED, -1),
+    (COLOR_PAIR_EXPIRED_DIM, COLOR_EXPIRED_RED_DIM, -1),
+    (COLOR_PAIR_FIELD, curses.COLOR_WHITE, 234),
+    (COLOR_PAIR_HIGHLIGHT_DIM, curses.COLOR_BLACK, 100),
+)
+
+# (color, red, green, blue) in curses' 0-1000 scale.
+_CUSTOM_COLORS: tuple[tuple[int, int, int, int], ...] = (
+    (COLOR_EXPIRED_RED, 750, 200, 200),
+    (COLOR_EXPIRED_RED_DIM, 600, 150, 150),
+)
+
+
 def init_curses() -> None:
     """Initialise colors and global curses settings."""
     curses.set_escdelay(25)
     curses.curs_set(0)
     curses.start_color()
     curses.use_default_colors()
-    curses.init_color(COLOR_EXPIRED_RED, 750, 200, 200)
-    curses.init_color(COLOR_EXPIRED_RED_DIM, 600, 150, 150)
-    curses.init_pair(COLOR_PAIR_SELECTED, curses.COLOR_BLACK, 80)
-    curses.init_pair(COLOR_PAIR_SELECTED_DIM, curses.COLOR_BLACK, 73)
-    curses.init_pair(COLOR_PAIR_SELECTED_DIM_MORE, curses.COLOR_BLACK, 23)
-    curses.init_pair(COLOR_PAIR_HEADER, curses.COLOR_YELLOW, -1)
-    curses.init_pair(COLOR_PAIR_MENU, curses.COLOR_BLACK, curses.COLOR_YELLOW)
-    curses.init_pair(COLOR_PAIR_FKEYS, curses.COLOR_BLACK, curses.COLOR_WHITE)
-    curses.init_pair(COLOR_PAIR_WHITE, 231, -1)
-    curses.init_pair(COLOR_PAIR_WHITE_DIM, curses.COLOR_WHITE, -1)
-    curses.init_pair(COLOR_PAIR_DARK, 245, -1)
-    curses.init_pair(COLOR_PAIR_DARKER, 237, -1)
-    curses.init_pair(COLOR_PAIR_CYAN, 116, -1)
-    curses.init_pair(COLOR_PAIR_CYAN_DIM, 73, -1)
-    curses.init_pair(COLOR_PAIR_EXPIRED, COLOR_EXPIRED_RED, -1)
-    curses.init_pair(COLOR_PAIR_EXPIRED_DIM, COLOR_EXPIRED_RED_DIM, -1)
-    curses.init_pair(COLOR_PAIR_FIELD, curses.COLOR_WHITE, 234)
-    curses.init_pair(COLOR_PAIR_HIGHLIGHT_DIM, curses.COLOR_BLACK, 100)
+    # Terminals with a fixed palette reject init_color; the expired pairs then
+    # fall back to whatever those palette slots already hold.
+    if curses.can_change_color():
+        for color, red, green, blue in _CUSTOM_COLORS:
+            curses.init_color(color, red, green, blue)
+    for pair, foreground, background in _COLOR_PAIRS:
+        curses.init_pair(pair, foreground, background)
     curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
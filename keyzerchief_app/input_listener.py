@@ -2,25 +2,46 @@
 
 from __future__ import annotations
 
-import threading
-from typing import Iterable
+from typing import Callable, Optional
 
 from pynput import keyboard
 
+# Windows virtual-key codes for VK_SHIFT, VK_LSHIFT and VK_RSHIFT.
+_WIN32_SHIFT_VKS = frozenset((0x10, 0xA0, 0xA1))
+
+
+def _win32_shift_filter(msg: int, data: object) -> bool:
+    """Pass only shift events on to the listener callbacks on Windows.
+
+    pynput still calls this filter for every event; it just spares the
+    other keys the ``_on_press``/``_on_release`` dispatch.
+    """
+
+    return getattr(data, "vkCode", None) in _WIN32_SHIFT_VKS
+
 
 class ModifierKeyMonitor:
-    """Track the state of modifier keys using a background listener."""
+    """Track the state of modifier keys using a background listener.
+
+    Held shift keys are kept as bits of a single int.  Only the listener thread
+    writes it and int loads/stores are atomic under the GIL, so no lock is needed.
+    """
 
-    _SHIFT_KEYS: tuple[keyboard.Key, ...] = (
-        keyboard.Key.shift,
-        keyboard.Key.shift_l,
-        keyboard.Key.shift_r,
-    )
+    _SHIFT_BITS: dict[keyboard.Key, int] = {
+        keyboard.Key.shift: 1,
+        keyboard.Key.shift_l: 2,
+        keyboard.Key.shift_r: 4,
+    }
 
     def __init__(self) -> None:
-        self._pressed_keys: set[keyboard.Key | keyboard.KeyCode] = set()
-        self._lock = threading.Lock()
+        self._shift_mask = 0
         self._listener: keyboard.Listener | None = None
+        self._on_change: Optional[Callable[[bool], None]] = None
+
+    def set_on_change(self, callback: Optional[Callable[[bool], None]]) -> None:
+        """Register ``callback`` to be invoked with the new shift state on transitions."""
+
+        self._on_change = callback
 
     def start(self) -> None:
         """Start the pynput listener if it isn't already running."""
@@ -28,9 +49,11 @@ class ModifierKeyMonitor:
         if self._listener is not None:
             return
 
+        # pynput only reads the ``win32_`` options on Windows; other backends ignore them.
         self._listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release,
+            win32_event_filter=_win32_shift_filter,
         )
         self._listener.daemon = True
         self._listener.start()
@@ -41,33 +64,49 @@ class ModifierKeyMonitor:
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
-        with self._lock:
-            self._pressed_keys.clear()
+        self._shift_mask = 0
 
     def _on_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
-        with self._lock:
-            self._pressed_keys.add(key)
+        bit = self._SHIFT_BITS.get(key)
+        if not bit:
+            return
+        was_shift = self._shift_mask != 0
+        self._shift_mask |= bit
+        if not was_shift:
+            self._notify(True)
 
     def _on_release(self, key: keyboard.Key | keyboard.KeyCode) -> None:
-        with self._lock:
-            self._pressed_keys.discard(key)
+        bit = self._SHIFT_BITS.get(key)
+        if not bit:
+            return
+        was_shift = self._shift_mask != 0
+        self._shift_mask &= ~bit
+        if was_shift and not self._shift_mask:
+            self._notify(False)
 
-    def _any_pressed(self, keys: Iterable[keyboard.Key]) -> bool:
-        with self._lock:
-            return any(key in self._pressed_keys for key in keys)
+    def _notify(self, shift_pressed: bool) -> None:
+        callback = self._on_change
+        if callback is not None:
+            callback(shift_pressed)
 
     def is_shift_pressed(self) -> bool:
         """Return ``True`` when any shift key is pressed."""
 
-        return self._any_pressed(self._SHIFT_KEYS)
+        return self._shift_mask != 0
 
 
 _MONITOR = ModifierKeyMonitor()
 
 
-def start_modifier_monitor() -> ModifierKeyMonitor:
-    """Ensure the global modifier monitor is running and return it."""
+def start_modifier_monitor(
+    on_change: Optional[Callable[[bool], None]] = None,
+) -> ModifierKeyMonitor:
+    """Ensure the global modifier monitor is running and return it.
+
+    ``on_change`` is called from the listener thread whenever the shift state flips.
+    """
 
+    _MONITOR.set_on_change(on_change)
     _MONITOR.start()
     return _MONITOR
 
@@ -75,4 +114,5 @@ def start_modifier_monitor() -> ModifierKeyMonitor:
 def stop_modifier_monitor() -> None:
     """Stop the global modifier monitor."""
 
+    _MONITOR.set_on_change(None)
     _MONITOR.stop()
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import curses
+import hashlib
+import mmap
+import os
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 import subprocess
 import shutil
+import time
 from typing import Iterable, Optional
 
 from .constants import BUTTON_SPACING, COLOR_PAIR_FIELD
@@ -21,6 +26,21 @@ TZ_MAP = {
     "CEST": "+0200",
 }
 
+# Coarser than any filesystem's mtime resolution (FAT rounds to 2 s).  Data
+# derived from a file is only cached once the file's mtime is older than this
+# relative to when it was read, so a same-size rewrite within one mtime tick
+# can never be mistaken for the cached contents.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Last parsed listing, keyed on the keystore's stat signature and password so
+# an unchanged file never re-launches keytool (and its JVM).  Saving copies the
+# working file elsewhere without touching it, so the key stays valid across saves.
+_ENTRIES_CACHE: dict[tuple, tuple[dict, ...]] = {}
+
+_ALIAS_KEY = "Alias name"
+# One ``key: value`` pair per line, surrounding blanks trimmed; the key ends at the first colon.
+_ENTRY_RE = re.compile(r"(?m)^[ \t]*([^:\n]*?)[ \t]*:[ \t]*(.*?)[ \t\r]*$")
+
 
 def check_password(keystore_path: Path | str, password: str) -> bool:
     """Return ``True`` if ``password`` unlocks ``keystore_path``."""
@@ -37,16 +57,60 @@ def check_password(keystore_path: Path | str, password: str) -> bool:
     return True
 
 
+def _file_digest(path: str, size: int) -> str:
+    """Return a blake2b digest of the ``size``-byte file at ``path``."""
+    if size == 0:
+        return hashlib.blake2b(b"").hexdigest()
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return hashlib.blake2b(view).hexdigest()
+
+
+# Digests of files whose mtime was already in the past when they were hashed,
+# keyed by path and checked against (size, mtime_ns).
+_DIGEST_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _fingerprint(path: Path | str, st: os.stat_result) -> tuple[int, str]:
+    """Return ``(size, digest)`` for ``path``, reusing the digest while its stat is unchanged.
+
+    A digest is only remembered when the file's mtime is older than the hash
+    by more than the mtime resolution, so a same-size rewrite in the same
+    tick can never be mistaken for the remembered contents.
+    """
+    key = str(path)
+    cached = _DIGEST_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return st.st_size, cached[2]
+
+    hashed_at = time.time_ns()
+    digest = _file_digest(key, st.st_size)
+    if st.st_mtime_ns < hashed_at - _RACY_WINDOW_NS:
+        _DIGEST_CACHE[key] = (st.st_size, st.st_mtime_ns, digest)
+    else:
+        _DIGEST_CACHE.pop(key, None)
+    return st.st_size, digest
+
+
 def check_unsaved_changes(state: AppState) -> None:
-    """Update ``state.has_unsaved_changes`` based on the keystore copies."""
+    """Update ``state.has_unsaved_changes`` based on the keystore copies.
+
+    Files of different sizes are dirty without reading them; otherwise their
+    digests are compared, and each digest is reused until the file changes.
+    """
     if not state.original_keystore_path or not state.keystore_path:
         state.mark_clean()
         return
 
     try:
-        with state.original_keystore_path.open("rb") as original, state.keystore_path.open("rb") as working:
-            state.has_unsaved_changes = original.read() != working.read()
-    except FileNotFoundError:
+        original_stat = os.stat(state.original_keystore_path)
+        working_stat = os.stat(state.keystore_path)
+        if original_stat.st_size != working_stat.st_size:
+            state.mark_dirty()
+            return
+        state.has_unsaved_changes = _fingerprint(state.original_keystore_path, original_stat) != _fingerprint(
+            state.keystore_path, working_stat
+        )
+    except OSError:
         # If either file disappears we conservatively assume the session is dirty.
         state.mark_dirty()
 
@@ -82,12 +146,9 @@ def save_changes(stdscr: "curses.window", state: AppState) -> Optional[str]:
             continue
         if ch in (10, 13):
             if selected_option == 0:
+                confirm_win.addstr(5, 2, "Saving...")
+                confirm_win.refresh()
                 shutil.copyfile(state.keystore_path, state.original_keystore_path)
-                confirm_win.addstr(5, 2, "Saving:                        ")
-                for i in range(30):
-                    confirm_win.addstr(5, 10 + i, "█")
-                    confirm_win.refresh()
-                    curses.napms(20)
                 state.mark_clean()
             break
         elif ch == 27:
@@ -97,16 +158,14 @@ def save_changes(stdscr: "curses.window", state: AppState) -> Optional[str]:
     return None
 
 
-def get_keystore_entries(state: AppState) -> list[dict]:
-    """Load and parse entries from the active keystore."""
-    if not state.keystore_path:
-        return []
-
-    result = subprocess.run(
+def _run_keytool_list(state: AppState, *extra_args: str) -> subprocess.CompletedProcess:
+    """Run ``keytool -list -v`` against the active keystore."""
+    return subprocess.run(
         [
             "keytool",
             "-list",
             "-v",
+            *extra_args,
             "-keystore",
             str(state.keystore_path),
             "-storepass",
@@ -116,59 +175,184 @@ def get_keystore_entries(state: AppState) -> list[dict]:
         stderr=subprocess.PIPE,
         text=True,
     )
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to load keystore:\n{result.stderr}")
 
+
+def _parse_entries(output: str) -> list[dict]:
+    """Split ``keytool -list -v`` output into raw entry dictionaries.
+
+    Lines before the first ``Alias name:`` (the keystore header) are ignored.
+    """
     entries: list[dict[str, str]] = []
-    current_entry: dict[str, str] = {}
-    lines = result.stdout.splitlines()[4:]
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith("Alias name:"):
-            if current_entry:
-                entries.append(current_entry)
-            current_entry = {"Alias name": line.split("Alias name:", 1)[1].strip()}
-            continue
-        if ":" in line:
-            key, value = map(str.strip, line.split(":", 1))
+    current_entry: Optional[dict[str, str]] = None
+    for key, value in _ENTRY_RE.findall(output):
+        if key == _ALIAS_KEY:
+            current_entry = {_ALIAS_KEY: value}
+            entries.append(current_entry)
+        elif current_entry is not None:
             current_entry[key] = value
-    if current_entry:
-        entries.append(current_entry)
+    return entries
 
-    for entry in entries:
-        entry_type = entry.get("Entry type", "")
-        entry_type_lower = entry_type.lower()
-        entry["__is_key__"] = "key" in entry_type_lower
-        entry["__is_cert__"] = "cert" in entry_type_lower or "trustedcert" in entry_type_lower
-
-        if "trustedcertentry" in entry_type_lower:
-            entry["__icon__"] = "⬔"
-        elif "privatekeyentry" in entry_type_lower:
-            entry["__icon__"] = "⬚"
-        else:
-            entry["__icon__"] = "☠"
-
-        detail_lines: list[tuple[str, str]] = []
-        priority = ["Alias name", "Entry type", "Creation date", "Valid from"]
-        keys = priority + [k for k in entry if k not in priority and not k.startswith("__")]
-        for key in keys:
-            value = entry.get(key, "")
-            detail_lines.append((key, value))
-        entry["__rendered__"] = detail_lines
-
-        valid_from = entry.get("Valid from")
-        if valid_from and "until:" in valid_from:
-            until_date = parse_until_date(valid_from)
-            if until_date is not None:
-                entry["__expired__"] = until_date < datetime.now(timezone.utc)
-            else:
-                entry["__expired__"] = False
-        else:
-            entry["__expired__"] = False
-
-    return filter_entries(entries, state.filter_state)
+
+def _annotate_entry(entry: dict) -> dict:
+    """Attach the derived ``__*__`` fields used by the UI."""
+    entry_type = entry.get("Entry type", "")
+    entry_type_lower = entry_type.lower()
+    entry["__is_key__"] = "key" in entry_type_lower
+    entry["__is_cert__"] = "cert" in entry_type_lower or "trustedcert" in entry_type_lower
+    entry["__is_private_key__"] = "privatekeyentry" in entry_type_lower
+    entry["__alias_lower__"] = entry.get(_ALIAS_KEY, "").lower()
+
+    if "trustedcertentry" in entry_type_lower:
+        entry["__icon__"] = "⬔"
+    elif entry["__is_private_key__"]:
+        entry["__icon__"] = "⬚"
+    else:
+        entry["__icon__"] = "☠"
+
+    detail_lines: list[tuple[str, str]] = []
+    priority = [_ALIAS_KEY, "Entry type", "Creation date", "Valid from"]
+    keys = priority + [k for k in entry if k not in priority and not k.startswith("__")]
+    for key in keys:
+        value = entry.get(key, "")
+        detail_lines.append((key, value))
+    entry["__rendered__"] = detail_lines
+
+    valid_from = entry.get("Valid from")
+    entry["__valid_until__"] = parse_until_date(valid_from) if valid_from and "until:" in valid_from else None
+    _mark_expired(entry, datetime.now(timezone.utc))
+    return entry
+
+
+def _mark_expired(entry: dict, now: datetime) -> None:
+    """Set ``__expired__`` from the entry's parsed ``__valid_until__`` date."""
+    until_date = entry["__valid_until__"]
+    entry["__expired__"] = until_date is not None and until_date < now
+
+
+def _index_aliases(entries: list[dict]) -> dict[str, int]:
+    return {entry.get(_ALIAS_KEY, ""): index for index, entry in enumerate(entries)}
+
+
+def _listing_key(state: AppState) -> Optional[tuple]:
+    """Return the cache key for the active keystore, or ``None`` if it cannot be stat'ed."""
+    try:
+        st = os.stat(state.keystore_path)
+    except OSError:
+        return None
+    password_hash = hashlib.blake2b(state.keystore_password.encode(), digest_size=8).hexdigest()
+    return (str(state.keystore_path), st.st_mtime_ns, st.st_size, password_hash)
+
+
+def get_keystore_entries(state: AppState) -> list[dict]:
+    """Load and parse entries from the active keystore.
+
+    The parsed listing is reused while the keystore file is unchanged.
+    Also rebuilds ``state.alias_index`` for the returned (filtered) list.
+    """
+    if not state.keystore_path:
+        state.alias_index = {}
+        return []
+
+    key = _listing_key(state)
+    entries = _ENTRIES_CACHE.get(key) if key is not None else None
+    if entries is None:
+        listed_at = time.time_ns()
+        result = _run_keytool_list(state)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to load keystore:\n{result.stderr}")
+
+        entries = tuple(_annotate_entry(entry) for entry in _parse_entries(result.stdout))
+        _ENTRIES_CACHE.clear()
+        # key[1] is the keystore's mtime_ns; see _RACY_WINDOW_NS.
+        if key is not None and key[1] < listed_at - _RACY_WINDOW_NS:
+            _ENTRIES_CACHE[key] = entries
+    else:
+        # Certificates keep expiring while the listing sits in the cache.
+        now = datetime.now(timezone.utc)
+        for entry in entries:
+            _mark_expired(entry, now)
+    filtered = filter_entries(entries, state.filter_state)
+    state.alias_index = _index_aliases(filtered)
+    return filtered
+
+
+def get_keystore_entry(state: AppState, alias: str) -> Optional[dict]:
+    """Load a single annotated entry, or ``None`` if keytool cannot list it."""
+    if not state.keystore_path:
+        return None
+
+    result = _run_keytool_list(state, "-alias", alias)
+    if result.returncode != 0:
+        return None
+
+    entries = _parse_entries(result.stdout)
+    if not entries:
+        return None
+    return _annotate_entry(entries[0])
+
+
+def refresh_entry(state: AppState, entries: list[dict], alias: str) -> list[dict]:
+    """Return ``entries`` with ``alias`` re-read from the keystore.
+
+    Only the given alias is listed and parsed; the entry replaces an existing
+    one with the alias keytool reports (which may differ in case from
+    ``alias``) or is appended.  Falls back to a full reload when the single
+    lookup fails.
+    """
+    entry = get_keystore_entry(state, alias)
+    if entry is None:
+        return get_keystore_entries(state)
+
+    stored_alias = entry[_ALIAS_KEY]
+    updated = list(entries)
+    position = state.alias_index.get(stored_alias)
+    if not filter_entries([entry], state.filter_state):
+        if position is None:
+            return entries
+        del updated[position]
+        state.alias_index = _index_aliases(updated)
+        return updated
+
+    if position is None:
+        state.alias_index[stored_alias] = len(updated)
+        updated.append(entry)
+    else:
+        updated[position] = entry
+    return updated
+
+
+def rename_cached_entry(state: AppState, entries: list[dict], old_alias: str, new_alias: str) -> list[dict]:
+    """Return ``entries`` with ``old_alias`` replaced in place by the renamed entry.
+
+    Only ``new_alias`` is listed, so the row shows the alias as keytool stored
+    it (JKS keystores lowercase aliases).  Falls back to a full reload if
+    ``old_alias`` is not in the current list or the lookup fails.
+    """
+    position = state.alias_index.get(old_alias)
+    entry = get_keystore_entry(state, new_alias) if position is not None else None
+    if entry is None:
+        return get_keystore_entries(state)
+
+    updated = list(entries)
+    if filter_entries([entry], state.filter_state):
+        updated[position] = entry
+        del state.alias_index[old_alias]
+        state.alias_index[entry[_ALIAS_KEY]] = position
+    else:
+        del updated[position]
+        state.alias_index = _index_aliases(updated)
+    return updated
+
+
+def drop_cached_entry(state: AppState, entries: list[dict], alias: str) -> list[dict]:
+    """Return ``entries`` without ``alias``, without running keytool."""
+    position = state.alias_index.get(alias)
+    if position is None:
+        return entries
+
+    updated = entries[:position] + entries[position + 1 :]
+    state.alias_index = _index_aliases(updated)
+    return updated
 
 
 def parse_until_date(valid_from: str) -> Optional[datetime]:
@@ -186,36 +370,48 @@ def parse_until_date(valid_from: str) -> Optional[datetime]:
 
 def filter_entries(entries: Iterable[dict], filter_state: dict[str, str]) -> list[dict]:
     """Filter ``entries`` based on ``filter_state`` selections."""
+    name_filter = filter_state.get("name", "").lower()
+    partial_name = filter_state.get("partial_name", "Yes") == "Yes"
+    hide_expired = filter_state.get("expired", "Yes") == "No"
+    hide_valid = filter_state.get("valid", "Yes") == "No"
+    hide_keys = filter_state.get("keys", "Yes") == "No"
+    hide_certs = filter_state.get("certificates", "Yes") == "No"
+
     filtered: list[dict] = []
     for entry in entries:
-        alias = entry.get("Alias name", "").lower()
-        name_filter = filter_state.get("name", "").lower()
         if name_filter:
-            if filter_state.get("partial_name", "Yes") == "Yes":
+            alias = entry.get("__alias_lower__")
+            if alias is None:
+                alias = entry.get(_ALIAS_KEY, "").lower()
+            if partial_name:
                 if name_filter not in alias:
                     continue
             elif name_filter != alias:
                 continue
 
         expired = bool(entry.get("__expired__", False))
-        if filter_state.get("expired", "Yes") == "No" and expired:
+        if hide_expired and expired:
             continue
-        if filter_state.get("valid", "Yes") == "No" and not expired:
+        if hide_valid and not expired:
             continue
-        if filter_state.get("keys", "Yes") == "No" and entry.get("__is_key__"):
+        if hide_keys and entry.get("__is_key__"):
             continue
-        if filter_state.get("certificates", "Yes") == "No" and entry.get("__is_cert__"):
+        if hide_certs and entry.get("__is_cert__"):
             continue
 
         filtered.append(entry)
     return filtered
 
 
-def find_entry_index_by_alias(entries: list[dict], alias: str | None) -> int:
-    """Return the index of ``alias`` in ``entries`` (defaulting to ``0``)."""
+def find_entry_index_by_alias(state: AppState, alias: str | None) -> int:
+    """Return the row of ``alias`` in the current entry list (defaulting to ``0``).
+
+    Looks ``alias`` up in ``state.alias_index``, falling back to its lowercased
+    form since JKS keystores store aliases lowercased.
+    """
     if not alias:
         return 0
-    for index, entry in enumerate(entries):
-        if entry.get("Alias name") == alias:
-            return index
-    return 0
+    position = state.alias_index.get(alias)
+    if position is None:
+        position = state.alias_index.get(alias.lower(), 0)
+    return position
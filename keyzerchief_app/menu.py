@@ -13,7 +13,7 @@ from .constants import (
     MENU_ITEMS,
 )
 from .state import AppState, default_filter_state
-from .ui.layout import draw_menu_bar, get_menu_item_positions
+from .ui.layout import draw_menu_bar, get_menu_item_at, get_menu_item_positions
 from .ui.popups import popup_form
 from .keystore_actions import open_keystore
 from .keystore import save_changes
@@ -140,26 +140,23 @@ def menu_modal(
         if key == curses.KEY_MOUSE:
             _, mx, my, _, mouse_event = curses.getmouse()
             if my == 0:
-                # Get accurate menu item positions
-                menu_positions = get_menu_item_positions()
-                for i, (start_x, end_x) in enumerate(menu_positions):
-                    if start_x <= mx < end_x:
-                        if active_menu == i:
-                            if submenu_win:
-                                submenu_win.clear()
-                                submenu_win.refresh()
-                            return None, None
-                        active_menu = i
+                clicked_menu = get_menu_item_at(mx)
+                if clicked_menu is not None:
+                    if active_menu == clicked_menu:
                         if submenu_win:
                             submenu_win.clear()
                             submenu_win.refresh()
-                            submenu_win = None
-                            selected_index = None
-                        if redraw_main_ui:
-                            redraw_main_ui()
-                        draw_menu_bar(active_menu, width, state)
-                        submenu_win = draw_submenu()
-                        break
+                        return None, None
+                    active_menu = clicked_menu
+                    if submenu_win:
+                        submenu_win.clear()
+                        submenu_win.refresh()
+                        submenu_win = None
+                        selected_index = None
+                    if redraw_main_ui:
+                        redraw_main_ui()
+                    draw_menu_bar(active_menu, width, state)
+                    submenu_win = draw_submenu()
 
             elif submenu_win and submenu_bounds:
                 # Check if click is inside the submenu window (including borders)
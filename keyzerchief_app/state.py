@@ -31,6 +31,7 @@ class AppState:
     mouse_enabled: bool = True
     right_panel_highlight_term: Optional[str] = None
     filter_state: dict[str, str] = field(default_factory=default_filter_state)
+    alias_index: dict[str, int] = field(default_factory=dict)
 
     def mark_dirty(self) -> None:
         self.has_unsaved_changes = True
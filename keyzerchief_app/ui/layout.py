@@ -2,7 +2,9 @@
 
 
 import curses
-from types import SimpleNamespace
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Sequence
 
 from ..constants import (
     COLOR_PAIR_CYAN,
@@ -26,9 +28,12 @@ from ..constants import (
 )
 from ..state import AppState
 
+# Stand-in row drawn while no keystore entries are available.
+_EMPTY_ENTRIES: tuple[dict, ...] = ({"Alias name": ""},)
+
 
 def draw_footer(
-    stdscr: "curses.window", state: AppState, options: list[str]
+    stdscr: "curses.window", state: AppState, options: Sequence[str]
 ) -> None:
     """Render the footer with contextual shortcuts."""
     height, width = stdscr.getmaxyx()
@@ -42,7 +47,7 @@ def draw_footer(
 
 
 def highlight_footer_key(
-    stdscr: "curses.window", key_index: int, options: list[str]
+    stdscr: "curses.window", key_index: int, options: Sequence[str]
 ) -> None:
     """Briefly highlight a footer label when its key is pressed."""
     height, width = stdscr.getmaxyx()
@@ -59,11 +64,15 @@ def highlight_footer_key(
     stdscr.addstr(height - 1, key_index * spacing + 2, label.ljust(spacing - 2), curses.color_pair(COLOR_PAIR_HEADER))
 
 
-def get_menu_item_positions() -> list[tuple[int, int]]:
+@lru_cache(maxsize=1)
+def get_menu_item_positions() -> tuple[tuple[int, int], ...]:
     """Calculate the start and end x positions for each menu item.
 
+    The menu bar does not depend on the terminal size, so the result is
+    computed once and shared by every caller.
+
     Returns:
-        List of (start_x, end_x) tuples for each menu item.
+        Tuple of (start_x, end_x) pairs for each menu item.
     """
     positions = []
     x = 1
@@ -75,7 +84,20 @@ def get_menu_item_positions() -> list[tuple[int, int]]:
         # Must match draw_menu_bar logic exactly:
         # x += len(item) + MENU_SPACING
         x += len(item) + MENU_SPACING
-    return positions
+    return tuple(positions)
+
+
+@lru_cache(maxsize=1)
+def _menu_item_starts() -> tuple[int, ...]:
+    return tuple(start_x for start_x, _ in get_menu_item_positions())
+
+
+def get_menu_item_at(x: int) -> int | None:
+    """Return the index of the menu item under column ``x``, if any."""
+    index = bisect_right(_menu_item_starts(), x) - 1
+    if index < 0 or x >= get_menu_item_positions()[index][1]:
+        return None
+    return index
 
 
 def draw_menu_bar(active_menu: int | None, width: int, state: AppState) -> None:
@@ -98,7 +120,7 @@ def draw_menu_bar(active_menu: int | None, width: int, state: AppState) -> None:
         center_x = (width - len(msg)) // 2
         bar_win.addstr(0, center_x, msg, curses.color_pair(COLOR_PAIR_SELECTED_DIM))
 
-    bar_win.refresh()
+    bar_win.noutrefresh()
 
 
 def draw_clock(stdscr: "curses.window", width: int) -> None:
@@ -109,7 +131,7 @@ def draw_clock(stdscr: "curses.window", width: int) -> None:
     time_str = f"{now.tm_hour:02d}{separator}{now.tm_min:02d}"
     x = width - len(time_str) - 1
     stdscr.addstr(0, x, time_str, curses.color_pair(COLOR_PAIR_HEADER) | curses.A_REVERSE)
-    stdscr.refresh()
+    stdscr.noutrefresh()
 
 
 def draw_ui(
@@ -122,9 +144,13 @@ def draw_ui(
     active_panel: int,
     dim: bool = False,
 ) -> int:
-    """Render the main two panel layout."""
+    """Render the main two panel layout.
+
+    Like the other ``draw_*`` helpers this only stages the window with
+    ``noutrefresh``; callers flush with ``curses.doupdate()`` or the next refresh.
+    """
     if not entries:
-        entries = [SimpleNamespace(get=lambda k, default=None: {"Alias name": ""}.get(k, default))]  # type: ignore
+        entries = _EMPTY_ENTRIES  # type: ignore[assignment]
 
     height, width = stdscr.getmaxyx()
     panel_width = width // 2
@@ -274,5 +300,5 @@ def draw_ui(
         stdscr.addstr(y, panel_width + 2, " " * (width - panel_width - 3))
 
     stdscr.move(0, 0)
-    stdscr.refresh()
+    stdscr.noutrefresh()
     return scroll_offset
@@ -17,6 +17,9 @@ from ..constants import (
     COLOR_PAIR_SELECTED,
 )
 
+# Keys that close the help popup: Esc, q/Q and Enter.
+_HELP_CLOSE_KEYS = frozenset((27, ord("q"), ord("Q"), 10, 13))
+
 
 def popup_box(win: "curses.window", title: str) -> None:
     """Draw a bordered popup window with a title."""
@@ -522,7 +525,7 @@ def show_help_popup(stdscr: "curses.window") -> None:
 
         key = win.getch()
 
-        if key in (27, ord("q"), ord("Q"), 10, 13):
+        if key in _HELP_CLOSE_KEYS:
             break
         if key == curses.KEY_UP and scroll_offset > 0:
             scroll_offset -= 1
@@ -175,6 +175,9 @@ class FakeWindow:
     def refresh(self) -> None:  # pragma: no cover - no-op
         return
 
+    def noutrefresh(self) -> None:  # pragma: no cover - no-op
+        return
+
     def keypad(self, flag: bool) -> None:  # pragma: no cover - no-op
         return
 
@@ -255,6 +258,9 @@ class FakeCurses:
     def init_color(self, index: int, r: int, g: int, b: int) -> None:
         self.custom_colors[index] = (r, g, b)
 
+    def can_change_color(self) -> bool:
+        return True
+
     def curs_set(self, _: int) -> None:  # pragma: no cover - no-op
         return
 
@@ -276,6 +282,9 @@ class FakeCurses:
     def napms(self, _: int) -> None:  # pragma: no cover - no-op
         return
 
+    def doupdate(self) -> None:  # pragma: no cover - no-op
+        return
+
 
 def _xterm_index_to_rgb(index: int) -> Tuple[int, int, int]:
     if index < 0:
@@ -0,0 +1,189 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import curses
+
+# Mock pynput before importing application modules
+sys.modules["pynput"] = MagicMock()
+sys.modules["pynput.keyboard"] = MagicMock()
+
+# Add project root to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from keyzerchief_app import app  # noqa: E402
+
+
+class TestWaitForInput(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_stdscr = MagicMock()
+
+    def test_read_pending_key_does_not_block(self):
+        self.mock_stdscr.getch.return_value = -1
+        self.assertEqual(app._read_pending_key(self.mock_stdscr), -1)
+        self.mock_stdscr.nodelay.assert_any_call(True)
+        self.mock_stdscr.nodelay.assert_called_with(False)
+
+    def test_buffered_key_skips_select(self):
+        self.mock_stdscr.getch.return_value = 65
+        with patch('keyzerchief_app.app.select.select') as mock_select:
+            key = app._wait_for_input(self.mock_stdscr, 3, 500)
+        self.assertEqual(key, 65)
+        mock_select.assert_not_called()
+        self.mock_stdscr.nodelay.assert_called_with(False)
+
+    @unittest.skipUnless(os.name == "posix", "wake pipe requires POSIX")
+    def test_wake_pipe_interrupts_wait(self):
+        read_fd, write_fd = app._open_wake_pipe()
+        try:
+            self.mock_stdscr.getch.return_value = -1
+            app._wake(write_fd)
+            with patch('keyzerchief_app.app.sys.stdin') as mock_stdin:
+                mock_stdin.fileno.return_value = read_fd
+                key = app._wait_for_input(self.mock_stdscr, read_fd, 5000)
+            self.assertEqual(key, -1)
+            with self.assertRaises(BlockingIOError):
+                os.read(read_fd, 1)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_polling_fallback_without_wake_fd(self):
+        self.mock_stdscr.getch.return_value = -1
+        key = app._wait_for_input(self.mock_stdscr, None, 900)
+        self.assertEqual(key, -1)
+        self.mock_stdscr.timeout.assert_any_call(app._SHIFT_POLL_MS)
+        self.mock_stdscr.timeout.assert_called_with(-1)
+
+    @patch('keyzerchief_app.app.curses')
+    @patch('keyzerchief_app.app.os.get_terminal_size', return_value=os.terminal_size((120, 40)))
+    def test_resize_to_terminal(self, mock_size, mock_curses):
+        with patch('keyzerchief_app.app.sys.__stdout__') as mock_stdout:
+            mock_stdout.fileno.return_value = 1
+            mock_curses.is_term_resized.return_value = True
+            app._resize_to_terminal()
+            mock_curses.resizeterm.assert_called_once_with(40, 120)
+            mock_curses.update_lines_cols.assert_called_once()
+
+            mock_curses.reset_mock()
+            mock_curses.is_term_resized.return_value = False
+            app._resize_to_terminal()
+            mock_curses.resizeterm.assert_not_called()
+
+
+class TestResolveFunctionKeyIndex(unittest.TestCase):
+
+    def test_plain_function_keys(self):
+        self.assertEqual(app._resolve_function_key_index(curses.KEY_F1), (0, False))
+        self.assertEqual(app._resolve_function_key_index(curses.KEY_F10), (9, False))
+
+    def test_shifted_function_keys(self):
+        self.assertEqual(app._resolve_function_key_index(curses.KEY_F13), (0, True))
+        self.assertEqual(app._resolve_function_key_index(curses.KEY_F13 + 9), (9, True))
+
+    def test_other_keys(self):
+        self.assertIsNone(app._resolve_function_key_index(ord("q")))
+        self.assertIsNone(app._resolve_function_key_index(curses.KEY_F11))
+
+
+class TestMoveSelection(unittest.TestCase):
+
+    def test_scrolls_to_keep_selection_visible(self):
+        self.assertEqual(app._move_selection(4, 0, 1, 10, 5), (5, 1))
+        self.assertEqual(app._move_selection(3, 3, -1, 10, 5), (2, 2))
+        self.assertEqual(app._move_selection(2, 0, 1, 10, 5), (3, 0))
+
+    def test_clamps_to_list_bounds(self):
+        self.assertEqual(app._move_selection(0, 0, -1, 10, 5), (0, 0))
+        self.assertEqual(app._move_selection(9, 5, 1, 10, 5), (9, 5))
+        self.assertEqual(app._move_selection(0, 0, 1, 0, 5), (0, 0))
+
+
+class TestFooterOptions(unittest.TestCase):
+
+    def test_set_password_hidden_for_certificates(self):
+        cert = {"__is_private_key__": False}
+        key = {"__is_private_key__": True}
+        self.assertEqual(app._footer_options(False, cert)[6], " 7      ")
+        self.assertEqual(app._footer_options(False, key)[6], " 7SetPwd")
+        self.assertEqual(app._footer_options(False, None)[6], " 7SetPwd")
+        self.assertIs(app._footer_options(True, cert), app._footer_options(True, key))
+
+
+class TestFunctionKeyHandlers(unittest.TestCase):
+
+    def setUp(self):
+        self.stdscr = MagicMock()
+        self.state = app.AppState()
+        self.redraw = MagicMock()
+
+    @patch('keyzerchief_app.app.delete_entry')
+    def test_delete_without_entries_is_noop(self, mock_delete):
+        context = app._FKeyContext([], 0, self.redraw)
+        self.assertTrue(app._FKEY_HANDLERS[7](self.stdscr, self.state, context))
+        mock_delete.assert_not_called()
+        self.redraw.assert_not_called()
+
+    @patch('keyzerchief_app.app.delete_entry', return_value=True)
+    def test_delete_drops_entry_and_clamps_selection(self, mock_delete):
+        self.state.alias_index = {'a': 0, 'b': 1}
+        context = app._FKeyContext([{'Alias name': 'a'}, {'Alias name': 'b'}], 1, self.redraw)
+        app._FKEY_HANDLERS[7](self.stdscr, self.state, context)
+        mock_delete.assert_called_once_with('b', self.stdscr, self.state)
+        self.assertEqual(context.selected, 0)
+        self.assertEqual(context.entries, [{'Alias name': 'a'}])
+
+    @patch('keyzerchief_app.app.check_unsaved_changes')
+    @patch('keyzerchief_app.app.refresh_entry')
+    def test_add_selects_lowercased_alias(self, mock_refresh, mock_check):
+        def refresh(state, entries, alias):
+            state.alias_index = {'a': 0, 'mycert': 1}
+            return entries + [{'Alias name': 'mycert'}]
+
+        mock_refresh.side_effect = refresh
+        handler = app._add_entry_handler(lambda stdscr, state: 'MyCert')
+        context = app._FKeyContext([{'Alias name': 'a'}], 0, self.redraw)
+        handler(self.stdscr, self.state, context)
+        self.assertEqual(context.selected, 1)
+
+    @patch('keyzerchief_app.app.save_changes', return_value=None)
+    def test_save_signals_exit(self, mock_save):
+        context = app._FKeyContext([], 0, self.redraw)
+        self.assertFalse(app._FKEY_HANDLERS[9](self.stdscr, self.state, context))
+
+
+class TestCaptureEscapeSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_stdscr = MagicMock()
+
+    def test_matches_shift_f3_sequence(self):
+        self.mock_stdscr.getch.side_effect = [ord(c) for c in "[1;2R"] + [ord("x")]
+        is_shift_f3, captured = app._capture_escape_sequence(self.mock_stdscr)
+        self.assertTrue(is_shift_f3)
+        self.assertEqual(captured, [ord(c) for c in "[1;2R"])
+        self.mock_stdscr.nodelay.assert_called_with(False)
+
+    @patch('keyzerchief_app.app.curses.tigetstr', return_value=b"\x1b[1;2R")
+    def test_capture_skipped_when_terminfo_decodes_shift_f3(self, mock_tigetstr):
+        self.assertEqual(app._undecoded_shift_f3_codes(), ())
+
+    @patch('keyzerchief_app.app.curses.tigetstr', return_value=None)
+    def test_all_sequences_captured_without_kf15(self, mock_tigetstr):
+        self.assertEqual(app._undecoded_shift_f3_codes(), app._SHIFT_F3_CODES)
+
+    def test_lone_escape(self):
+        self.mock_stdscr.getch.return_value = -1
+        is_shift_f3, captured = app._capture_escape_sequence(self.mock_stdscr)
+        self.assertFalse(is_shift_f3)
+        self.assertEqual(captured, [])
+
+    def test_drain_is_bounded(self):
+        self.mock_stdscr.getch.return_value = ord("a")
+        _, captured = app._capture_escape_sequence(self.mock_stdscr)
+        self.assertEqual(len(captured), app._ESCAPE_CAPTURE_LIMIT)
+
+
+if __name__ == '__main__':
+    unittest.main()
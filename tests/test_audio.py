@@ -10,44 +10,49 @@ sys.modules["pynput.keyboard"] = MagicMock()
 # Add project root to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from keyzerchief_app import audio
 from keyzerchief_app.audio import play_sfx
 
 class TestAudio(unittest.TestCase):
 
-    @patch('keyzerchief_app.audio.platform.system')
-    @patch('keyzerchief_app.audio.subprocess.Popen')
-    def test_play_sfx_macos(self, mock_popen, mock_system):
-        mock_system.return_value = "Darwin"
-        
-        # play_sfx starts a thread, so we need to wait for it or just verify the thread start logic
-        # However, since the thread target is an inner function, we can't easily mock it directly without refactoring.
-        # But we can verify that Popen is called if we let the thread run (it's daemon).
-        # Actually, unit testing threaded code is tricky.
-        # A better approach for this simple function is to mock threading.Thread to run synchronously or verify it was called.
-        
-        with patch('keyzerchief_app.audio.threading.Thread') as mock_thread:
-            play_sfx("beep")
-            mock_thread.assert_called_once()
-            
-            # Get the target function passed to Thread
-            target = mock_thread.call_args[1]['target']
-            
-            # Execute the target function to verify subprocess call
-            target()
-            
-            mock_popen.assert_called_once()
-            args = mock_popen.call_args[0][0]
-            self.assertEqual(args[0], "afplay")
-            self.assertIn("beep.mp3", str(args[1]))
-
-    @patch('keyzerchief_app.audio.platform.system')
-    @patch('keyzerchief_app.audio.subprocess.Popen')
-    def test_play_sfx_non_macos(self, mock_popen, mock_system):
-        mock_system.return_value = "Linux"
-        
+    def tearDown(self):
+        audio._players.clear()
+
+    @patch('keyzerchief_app.audio._IS_MACOS', True)
+    @patch('keyzerchief_app.audio.os.waitpid', return_value=(0, 0))
+    @patch('keyzerchief_app.audio.os.posix_spawnp', create=True)
+    def test_play_sfx_macos(self, mock_spawn, mock_waitpid):
+        mock_spawn.return_value = 1234
+
+        play_sfx("beep")
+
+        mock_spawn.assert_called_once()
+        path, args = mock_spawn.call_args[0][:2]
+        self.assertEqual(path, "afplay")
+        self.assertEqual(args[0], "afplay")
+        self.assertIn("beep.mp3", args[1])
+        self.assertEqual(args[2:], ["-v", "0.6"])
+        self.assertIn(1234, audio._players)
+
+    @patch('keyzerchief_app.audio._IS_MACOS', True)
+    @patch('keyzerchief_app.audio.os.waitpid', return_value=(1234, 0))
+    @patch('keyzerchief_app.audio.os.posix_spawnp', create=True)
+    def test_finished_players_are_reaped(self, mock_spawn, mock_waitpid):
+        audio._players.add(1234)
+        mock_spawn.return_value = 5678
+
         play_sfx("beep")
-        
-        mock_popen.assert_not_called()
+
+        mock_waitpid.assert_called_once_with(1234, os.WNOHANG)
+        self.assertEqual(audio._players, {5678})
+
+    @patch('keyzerchief_app.audio._IS_MACOS', False)
+    @patch('keyzerchief_app.audio.os.posix_spawnp', create=True)
+    def test_play_sfx_non_macos(self, mock_spawn):
+
+        play_sfx("beep")
+
+        mock_spawn.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
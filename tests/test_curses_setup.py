@@ -31,5 +31,14 @@ class TestCursesSetup(unittest.TestCase):
         # Verify mousemask
         mock_curses.mousemask.assert_called_once()
 
+    @patch('keyzerchief_app.curses_setup.curses')
+    def test_init_curses_fixed_palette(self, mock_curses):
+        mock_curses.can_change_color.return_value = False
+        init_curses()
+
+        mock_curses.init_color.assert_not_called()
+        self.assertTrue(mock_curses.init_pair.called)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,7 +10,7 @@ sys.modules["pynput.keyboard"] = MagicMock()
 # Add project root to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from keyzerchief_app.input_listener import ModifierKeyMonitor
+from keyzerchief_app.input_listener import ModifierKeyMonitor, _win32_shift_filter, keyboard
 
 class TestModifierKeyMonitor(unittest.TestCase):
 
@@ -39,24 +39,27 @@ class TestModifierKeyMonitor(unittest.TestCase):
 
     def test_key_tracking(self):
         key = MagicMock()
-        
-        # Test on_press
+
+        # Non-shift keys are ignored
         self.monitor._on_press(key)
-        self.assertIn(key, self.monitor._pressed_keys)
-        
-        # Test on_release
-        self.monitor._on_release(key)
-        self.assertNotIn(key, self.monitor._pressed_keys)
+        self.assertEqual(self.monitor._shift_mask, 0)
+
+        # Each shift key owns one bit
+        self.monitor._on_press(keyboard.Key.shift_l)
+        self.monitor._on_press(keyboard.Key.shift_r)
+        self.monitor._on_release(keyboard.Key.shift_l)
+        self.assertTrue(self.monitor.is_shift_pressed())
+
+        self.monitor._on_release(keyboard.Key.shift_r)
+        self.assertEqual(self.monitor._shift_mask, 0)
 
     def test_is_shift_pressed(self):
         # Mock keyboard keys
         shift_key = MagicMock()
         other_key = MagicMock()
         
-        # We need to match the keys used in the class
-        # Since we mocked pynput.keyboard, ModifierKeyMonitor._SHIFT_KEYS will contain mocks
-        # We need to make sure we use one of those mocks
-        target_shift = self.monitor._SHIFT_KEYS[0]
+        # Since we mocked pynput.keyboard, the shift keys are mocks too
+        target_shift = keyboard.Key.shift
         
         self.assertFalse(self.monitor.is_shift_pressed())
         
@@ -69,5 +72,24 @@ class TestModifierKeyMonitor(unittest.TestCase):
         self.monitor._on_press(other_key)
         self.assertFalse(self.monitor.is_shift_pressed())
 
+    def test_on_change_fires_on_shift_transitions(self):
+        changes = []
+        self.monitor.set_on_change(changes.append)
+        target_shift = keyboard.Key.shift
+        other_key = MagicMock()
+
+        self.monitor._on_press(other_key)
+        self.monitor._on_press(target_shift)
+        self.monitor._on_press(target_shift)
+        self.monitor._on_release(target_shift)
+        self.monitor._on_release(other_key)
+
+        self.assertEqual(changes, [True, False])
+
+    def test_win32_filter_passes_only_shift(self):
+        self.assertTrue(_win32_shift_filter(0x100, MagicMock(vkCode=0xA0)))
+        self.assertTrue(_win32_shift_filter(0x101, MagicMock(vkCode=0x10)))
+        self.assertFalse(_win32_shift_filter(0x100, MagicMock(vkCode=0x41)))
+
 if __name__ == '__main__':
     unittest.main()
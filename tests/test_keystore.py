@@ -4,6 +4,9 @@ from datetime import datetime, timezone
 import sys
 import os
 import subprocess
+import tempfile
+import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 # Mock pynput before importing application modules to avoid X server requirement in CI
@@ -14,12 +17,16 @@ sys.modules["pynput.keyboard"] = MagicMock()
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from keyzerchief_app.keystore import (
+    _file_digest,
     get_keystore_entries,
     parse_until_date,
     check_password,
     check_unsaved_changes,
     filter_entries,
-    find_entry_index_by_alias
+    find_entry_index_by_alias,
+    refresh_entry,
+    drop_cached_entry,
+    rename_cached_entry,
 )
 from keyzerchief_app.state import AppState, default_filter_state
 
@@ -33,7 +40,7 @@ class TestKeystoreParsing(unittest.TestCase):
     @patch('keyzerchief_app.keystore.subprocess.run')
     def test_get_keystore_entries_success(self, mock_run):
         # Sample output from keytool -list -v
-        # Note: The parser skips the first 4 lines
+        # Note: The parser ignores the header before the first alias
         sample_output = """
 Keystore type: PKCS12
 Keystore provider: SUN
@@ -74,14 +81,19 @@ Valid from: Thu Nov 23 10:00:00 UTC 2023 until: Sun Nov 23 10:00:00 UTC 2025
         self.assertEqual(entries[0]['Alias name'], 'mykey')
         self.assertTrue(entries[0]['__is_key__'])
         self.assertFalse(entries[0]['__is_cert__'])
+        self.assertTrue(entries[0]['__is_private_key__'])
         self.assertEqual(entries[0]['Serial number'], '12345678')
 
         # Check second entry (trustedCertEntry)
         self.assertEqual(entries[1]['Alias name'], 'trustedcert')
         self.assertFalse(entries[1]['__is_key__'])
         self.assertTrue(entries[1]['__is_cert__'])
+        self.assertFalse(entries[1]['__is_private_key__'])
         self.assertEqual(entries[1]['Serial number'], '87654321')
 
+        # Alias index tracks positions in the returned list
+        self.assertEqual(self.state.alias_index, {'mykey': 0, 'trustedcert': 1})
+
     @patch('keyzerchief_app.keystore.subprocess.run')
     def test_get_keystore_entries_empty(self, mock_run):
         sample_output = """
@@ -98,6 +110,143 @@ Your keystore contains 0 entries
         entries = get_keystore_entries(self.state)
         self.assertEqual(len(entries), 0)
 
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_get_keystore_entries_reuses_listing_until_file_changes(self, mock_run):
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "Alias name: mykey\nEntry type: PrivateKeyEntry\n"
+        mock_run.return_value = mock_result
+
+        def age(path):
+            old_ns = time.time_ns() - 60_000_000_000
+            os.utime(path, ns=(old_ns, old_ns))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self.state.keystore_path = Path(tmp) / "work.jks"
+            self.state.keystore_path.write_bytes(b"one")
+            age(self.state.keystore_path)
+
+            first = get_keystore_entries(self.state)
+            second = get_keystore_entries(self.state)
+            self.assertEqual(mock_run.call_count, 1)
+            self.assertEqual(first, second)
+
+            self.state.keystore_path.write_bytes(b"longer")
+            age(self.state.keystore_path)
+            get_keystore_entries(self.state)
+            self.assertEqual(mock_run.call_count, 2)
+
+            self.state.keystore_password = "other"
+            get_keystore_entries(self.state)
+            self.assertEqual(mock_run.call_count, 3)
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_get_keystore_entries_skips_cache_for_recent_writes(self, mock_run):
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "Alias name: mykey\nEntry type: PrivateKeyEntry\n"
+        mock_run.return_value = mock_result
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # Just written: a same-size rewrite could still keep this mtime
+            self.state.keystore_path = Path(tmp) / "work.jks"
+            self.state.keystore_path.write_bytes(b"one")
+
+            get_keystore_entries(self.state)
+            get_keystore_entries(self.state)
+            self.assertEqual(mock_run.call_count, 2)
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_cached_entries_refresh_expiry(self, mock_run):
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = (
+            "Alias name: mycert\nEntry type: trustedCertEntry\n"
+            "Valid from: Thu Nov 23 10:00:00 UTC 2023 until: Fri Nov 22 10:00:00 UTC 2024\n"
+        )
+        mock_run.return_value = mock_result
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self.state.keystore_path = Path(tmp) / "work.jks"
+            self.state.keystore_path.write_bytes(b"one")
+            old_ns = time.time_ns() - 60_000_000_000
+            os.utime(self.state.keystore_path, ns=(old_ns, old_ns))
+
+            with patch('keyzerchief_app.keystore.datetime', wraps=datetime) as mock_datetime:
+                mock_datetime.now.return_value = datetime(2024, 1, 1, tzinfo=timezone.utc)
+                entries = get_keystore_entries(self.state)
+                self.assertFalse(entries[0]['__expired__'])
+
+                mock_datetime.now.return_value = datetime(2025, 1, 1, tzinfo=timezone.utc)
+                entries = get_keystore_entries(self.state)
+            self.assertEqual(mock_run.call_count, 1)
+            self.assertTrue(entries[0]['__expired__'])
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_refresh_entry_only_lists_alias(self, mock_run):
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = """Alias name: newcert
+Creation date: Nov 23, 2023
+Entry type: trustedCertEntry
+"""
+        mock_run.return_value = mock_result
+        existing = [{'Alias name': 'mykey'}]
+        self.state.alias_index = {'mykey': 0}
+
+        entries = refresh_entry(self.state, existing, 'newcert')
+
+        self.assertIn('-alias', mock_run.call_args[0][0])
+        self.assertEqual([e['Alias name'] for e in entries], ['mykey', 'newcert'])
+        self.assertTrue(entries[1]['__is_cert__'])
+        self.assertEqual(self.state.alias_index, {'mykey': 0, 'newcert': 1})
+
+        # Re-importing the same alias replaces it in place
+        entries = refresh_entry(self.state, entries, 'newcert')
+        self.assertEqual(len(entries), 2)
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_refresh_entry_matches_alias_as_stored(self, mock_run):
+        # JKS keystores lowercase aliases, so keytool reports "mycert" for "MyCert"
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "Alias name: mycert\nEntry type: trustedCertEntry\n"
+        mock_run.return_value = mock_result
+        existing = [{'Alias name': 'mykey'}, {'Alias name': 'mycert'}]
+        self.state.alias_index = {'mykey': 0, 'mycert': 1}
+
+        entries = refresh_entry(self.state, existing, 'MyCert')
+
+        self.assertEqual([e['Alias name'] for e in entries], ['mykey', 'mycert'])
+        self.assertEqual(self.state.alias_index, {'mykey': 0, 'mycert': 1})
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_rename_cached_entry_uses_alias_as_stored(self, mock_run):
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "Alias name: renamed\nEntry type: PrivateKeyEntry\n"
+        mock_run.return_value = mock_result
+        entries = [{'Alias name': 'a', 'Entry type': 'PrivateKeyEntry'}, {'Alias name': 'b'}]
+        self.state.alias_index = {'a': 0, 'b': 1}
+
+        entries = rename_cached_entry(self.state, entries, 'a', 'ReNamed')
+
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index('-alias') + 1], 'ReNamed')
+        self.assertEqual(entries[0]['Alias name'], 'renamed')
+        self.assertEqual(entries[0]['__rendered__'][0], ('Alias name', 'renamed'))
+        self.assertEqual(self.state.alias_index, {'renamed': 0, 'b': 1})
+
+    @patch('keyzerchief_app.keystore.subprocess.run')
+    def test_drop_cached_entry_skips_keytool(self, mock_run):
+        entries = [{'Alias name': 'renamed'}, {'Alias name': 'b'}]
+        self.state.alias_index = {'renamed': 0, 'b': 1}
+
+        entries = drop_cached_entry(self.state, entries, 'renamed')
+        self.assertEqual([e['Alias name'] for e in entries], ['b'])
+        self.assertEqual(self.state.alias_index, {'b': 0})
+        mock_run.assert_not_called()
+
     def test_parse_until_date(self):
         # Test standard format
         valid_from = "Valid from: Thu Nov 23 10:00:00 UTC 2023 until: Fri Nov 22 10:00:00 UTC 2024"
@@ -171,14 +320,12 @@ Your keystore contains 0 entries
         self.assertNotIn("beta", [e["Alias name"] for e in filtered])
 
     def test_find_entry_index_by_alias(self):
-        entries = [
-            {"Alias name": "one"},
-            {"Alias name": "two"},
-            {"Alias name": "three"},
-        ]
-        self.assertEqual(find_entry_index_by_alias(entries, "two"), 1)
-        self.assertEqual(find_entry_index_by_alias(entries, "four"), 0) # Default to 0 if not found
-        self.assertEqual(find_entry_index_by_alias(entries, None), 0)
+        self.state.alias_index = {"one": 0, "two": 1, "three": 2}
+        self.assertEqual(find_entry_index_by_alias(self.state, "two"), 1)
+        self.assertEqual(find_entry_index_by_alias(self.state, "four"), 0) # Default to 0 if not found
+        self.assertEqual(find_entry_index_by_alias(self.state, None), 0)
+        # keytool may have lowercased the alias the user typed
+        self.assertEqual(find_entry_index_by_alias(self.state, "Three"), 2)
 
     @patch('keyzerchief_app.keystore.subprocess.run')
     def test_check_password(self, mock_run):
@@ -195,32 +342,46 @@ Your keystore contains 0 entries
         self.assertFalse(check_password("dummy.jks", "wrong"))
 
     def test_check_unsaved_changes(self):
-        # Setup mocks for file opening
-        self.state.original_keystore_path = MagicMock()
-        self.state.keystore_path = MagicMock()
-
-        # Mock context managers
-        mock_orig_file = MagicMock()
-        mock_work_file = MagicMock()
-
-        self.state.original_keystore_path.open.return_value.__enter__.return_value = mock_orig_file
-        self.state.keystore_path.open.return_value.__enter__.return_value = mock_work_file
-
-        # Case 1: Content identical
-        mock_orig_file.read.return_value = b"content"
-        mock_work_file.read.return_value = b"content"
-        check_unsaved_changes(self.state)
-        self.assertFalse(self.state.has_unsaved_changes)
-
-        # Case 2: Content different
-        mock_work_file.read.return_value = b"modified"
-        check_unsaved_changes(self.state)
-        self.assertTrue(self.state.has_unsaved_changes)
-
-        # Case 3: FileNotFoundError
-        self.state.original_keystore_path.open.side_effect = FileNotFoundError
-        check_unsaved_changes(self.state)
-        self.assertTrue(self.state.has_unsaved_changes)
+        with tempfile.TemporaryDirectory() as tmp:
+            self.state.original_keystore_path = Path(tmp) / "original.jks"
+            self.state.keystore_path = Path(tmp) / "work.jks"
+
+            # Case 1: Content identical
+            self.state.original_keystore_path.write_bytes(b"content")
+            self.state.keystore_path.write_bytes(b"content")
+            check_unsaved_changes(self.state)
+            self.assertFalse(self.state.has_unsaved_changes)
+
+            # Case 2: Same-size rewrite of the same path within one mtime tick
+            working_stat = os.stat(self.state.keystore_path)
+            self.state.keystore_path.write_bytes(b"CONTENT")
+            os.utime(self.state.keystore_path, ns=(working_stat.st_atime_ns, working_stat.st_mtime_ns))
+            check_unsaved_changes(self.state)
+            self.assertTrue(self.state.has_unsaved_changes)
+
+            # Files last modified well before the check reuse their digests
+            self.state.keystore_path.write_bytes(b"content")
+            old_ns = time.time_ns() - 60_000_000_000
+            for path in (self.state.original_keystore_path, self.state.keystore_path):
+                os.utime(path, ns=(old_ns, old_ns))
+            with patch('keyzerchief_app.keystore._file_digest', wraps=_file_digest) as mock_digest:
+                check_unsaved_changes(self.state)
+                check_unsaved_changes(self.state)
+            self.assertEqual(mock_digest.call_count, 2)
+            self.assertFalse(self.state.has_unsaved_changes)
+
+            # Case 3: Different size is dirty without reading either file
+            self.state.keystore_path.write_bytes(b"modified")
+            with patch('keyzerchief_app.keystore._file_digest') as mock_digest:
+                check_unsaved_changes(self.state)
+            mock_digest.assert_not_called()
+            self.assertTrue(self.state.has_unsaved_changes)
+
+            # Case 4: Missing file
+            self.state.mark_clean()
+            self.state.original_keystore_path.unlink()
+            check_unsaved_changes(self.state)
+            self.assertTrue(self.state.has_unsaved_changes)
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,7 +10,12 @@ sys.modules["pynput.keyboard"] = MagicMock()
 # Add project root to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from keyzerchief_app.ui.layout import draw_footer, draw_menu_bar  # noqa: E402
+from keyzerchief_app.ui.layout import (  # noqa: E402
+    draw_footer,
+    draw_menu_bar,
+    get_menu_item_at,
+    get_menu_item_positions,
+)
 from keyzerchief_app.state import AppState  # noqa: E402
 
 
@@ -43,7 +48,15 @@ class TestLayout(unittest.TestCase):
 
         mock_newwin.assert_called_once_with(1, 80, 0, 0)
         self.assertTrue(mock_bar_win.addstr.called)
-        mock_bar_win.refresh.assert_called_once()
+        mock_bar_win.noutrefresh.assert_called_once()
+
+    def test_get_menu_item_at(self):
+        for index, (start_x, end_x) in enumerate(get_menu_item_positions()):
+            self.assertEqual(get_menu_item_at(start_x), index)
+            self.assertEqual(get_menu_item_at(end_x - 1), index)
+        self.assertIsNone(get_menu_item_at(0))
+        self.assertIsNone(get_menu_item_at(get_menu_item_positions()[0][1]))
+        self.assertIsNone(get_menu_item_at(200))
 
 
 if __name__ == '__main__':
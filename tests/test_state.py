@@ -13,6 +13,7 @@ class TestAppState(unittest.TestCase):
         self.assertTrue(state.mouse_enabled)
         self.assertIsNone(state.right_panel_highlight_term)
         self.assertEqual(state.filter_state, default_filter_state())
+        self.assertEqual(state.alias_index, {})
 
     def test_mark_dirty_clean(self):
         state = AppState()